@@ -1,6 +1,10 @@
-import copy
+import logging
+import queue
+import threading
 import time
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from itertools import groupby
 from operator import itemgetter
 from typing import *
@@ -8,29 +12,51 @@ from typing import *
 from cad_error import RhicError
 from cad_io import adoIf
 
-from .request import (AsyncID, Callback, Entry, Metadata, MultinetError,
-                      MultinetResponse, Request)
+from .request import (META_CACHE_TIMEOUT, AsyncID, Callback, Entry, Metadata,
+                      MultinetError, MultinetResponse, Request)
+
+DEFAULT_PPM_USER_TIMEOUT = 60.0
+"""Seconds before the machine's default PPM user is fetched again"""
+
+
+@lru_cache(maxsize=1024)
+def _timestamp_source_key(entry: Entry) -> Entry:
+    # reported alongside every fallback timestamp; built once per timestamp entry
+    return (*entry[:-1], "timestampSource")
 
 
 class AdoRequest(Request):
     _tid_map = {}
-
-    def __init__(self):
+    _io_executor = ThreadPoolExecutor(thread_name_prefix="multinet-io")
+    _io_lock = threading.Lock()
+    _default_ppm_user: Optional[Tuple[float, int]] = None
+    # unbounded so adoIf's delivery thread never waits on user code
+    _dispatch_queue: "queue.SimpleQueue[Tuple[int, Callback, MultinetResponse, int]]" = queue.SimpleQueue()
+    _dispatch_thread: Optional[threading.Thread] = None
+    _dispatch_lock = threading.Lock()
+
+    def __init__(self, meta_timeout: float = META_CACHE_TIMEOUT):
         super().__init__()
+        self.meta_timeout = meta_timeout
         self._meta = {}
         self._handles = {}
+        self._handle_locks: Dict[str, threading.Lock] = {}
+        self._meta_cache: Dict[str, Tuple[float, Any]] = {}
         self._async_id_map: Dict[AsyncID, List[int]] = {}
 
     def default_ppm_user(self):
+        cached = AdoRequest._default_ppm_user
+        if cached is not None and time.monotonic() - cached[0] < DEFAULT_PPM_USER_TIMEOUT:
+            return cached[1]
         try:
-            r = AdoRequest()
             entry = ("injSpec.super", "agsPpmUserM")
-            result = r.get(entry)
+            result = self.get(entry)
             ppm_user = result.get(entry)
-            if ppm_user < 1 or ppm_user > 8:
+            if not 1 <= ppm_user <= 8:
                 ppm_user = 1
         except:
             ppm_user = 1
+        AdoRequest._default_ppm_user = (time.monotonic(), ppm_user)
         return ppm_user
 
     def get_async(
@@ -50,72 +76,156 @@ class AdoRequest(Request):
 
         entries, response = self._parse_entries(entries, timestamps=kwargs.get("timestamp", False))
 
-        metadata = self.get_meta(*entries)
+        groups = self._group_by_ado(entries)
+        metadata = self._get_meta_for_groups(groups)
         # if any of the meta data was not acquired, assume the device/parameter was not valid/available
         # and remove it from the request that will be sent out
-        for dev, value in metadata.items():
-            if isinstance(value, MultinetError):
-                entries.remove(dev)
-                response[dev] = value
+        unavailable = {
+            dev: value
+            for dev, value in metadata.data.items()
+            if isinstance(value, MultinetError)
+        }
+        if unavailable:
+            entries = [entry for entry in entries if entry not in unavailable]
+            groups = self._group_by_ado(entries)
+            response.update(unavailable)
         self._meta.update(metadata)
 
         if grouping == "ado":
-            grouped_entries = [
-                tuple(group) for _, group in groupby(entries, lambda e: e[0])
-            ]
+            grouped_entries = list(groups.values())
         elif grouping == "parameter":
-            grouped_entries = [
-                tuple(group) for _, group in groupby(entries, lambda e: e[0:2])
-            ]
+            buckets: Dict[Tuple[str, str], List[Entry]] = {}
+            for entry in entries:
+                buckets.setdefault(entry[:2], []).append(entry)
+            grouped_entries = list(buckets.values())
         elif grouping == "individual":
-            grouped_entries = [(entry,) for entry in entries]
+            grouped_entries = [[entry] for entry in entries]
         else:
             raise ValueError(f"Invalid grouping type '{grouping}'")
 
-        if not isinstance(ppm_user, Iterable):
+        if isinstance(ppm_user, int) or not isinstance(ppm_user, Iterable):
             ppm_user = [ppm_user]
 
-        # invalid_user will be used to allow only ONE default_ppm_user to be used when checking ppm_user array
-        num_default_ppm_user = 0
-        default_user = self.default_ppm_user()
+        # request lists and scalar masks are shared by every PPM user's subscription
+        group_requests = []
+        for group in grouped_entries:
+            handle = self._get_handle(group[0][0])
+            if not handle:
+                response.update(
+                    dict.fromkeys(group, MultinetError(RhicError.IO_BAD_NAME))
+                )
+                group_requests.append(None)
+                continue
+            group_requests.append(
+                (
+                    [(handle, entry[1], entry[2]) for entry in group],
+                    self._scalar_mask(group, metadata),
+                )
+            )
+
+        async_id = next(self._mreq_tid_iter)
+        # invalid users resolve to the default user, which is only requested once like any other user
+        requested_users: List[int] = []
+        # (group index, ppm user) of every subscription to arm
+        subscriptions = []
         for puser in ppm_user:
-            if puser < 1 or puser > 8:
-                puser = default_user
-                num_default_ppm_user += 1
+            if not 1 <= puser <= 8:
+                puser = self.default_ppm_user()
             # avoid duplicate ppm requests
-            if (ppm_user.count(puser) > 1) or (puser == default_user and num_default_ppm_user>0):
+            if puser in requested_users:
                 continue
+            requested_users.append(puser)
             self.logger.debug("args[%d]: %s", len(entries), entries)
+            subscriptions += [
+                (i, puser)
+                for i, request in enumerate(group_requests)
+                if request is not None
+            ]
+
+        self._start_dispatcher()
+        if immediate:
+            # delivered on the calling thread before arming, so it precedes any async update
+            self._deliver_initial(
+                callback, groups, grouped_entries, requested_users, metadata
+            )
+
+        # submit every subscription to the I/O pool at once; each registers its tid as soon as it is armed
+        results = self._map_io(
+            self._arm_async,
+            [
+                {
+                    "group": grouped_entries[i],
+                    "scalars": group_requests[i][1],
+                    "callback": callback,
+                    "list": group_requests[i][0],
+                    "ppmIndex": puser - 1,
+                }
+                for i, puser in subscriptions
+            ],
+        )
+        io_tids = []
+        for (i, _), (tid, status) in zip(subscriptions, results):
+            group = grouped_entries[i]
+            io_tids.append(tid)
+            response.data.update(
+                (entry, None if st == 0 else MultinetError(st))
+                for entry, st in zip(group, status)
+            )
 
-            async_id = next(self._mreq_tid_iter)
-            io_tids = []
-            for group in grouped_entries:
-                if immediate:
-                    callback(
-                        self.get(*group, ppm_user=puser), puser
-                    )
-                group = list(group)
-                ado_name = group[0][0]
-                handle = self._get_handle(ado_name)
-                if not handle:
-                    response.update(
-                        dict.fromkeys(group, MultinetError(RhicError.IO_BAD_NAME))
-                    )
-                    continue
-                tid, status = adoIf.adoGetAsync(
-                    list=[(handle, *rest) for _, *rest in group],
-                    ppmIndex=puser - 1,
-                    callback=self._async_callback,
-                )
-                self._tid_map[tid] = (group, metadata, callback, self)
-                io_tids.append(tid)
-                for entry, st in zip(group, status):
-                    response[entry] = None if st == 0 else MultinetError(st)
-                
         self._async_id_map[async_id] = io_tids
         response.tid = async_id
         return response
 
+    def _arm_async(
+        self, group: List[Entry], scalars: List[bool], callback: Callback, **kwargs
+    ) -> Tuple[int, List[int]]:
+        """Arm one subscription with `adoGetAsync` and register its tid before returning
+
+        Registering here rather than once every subscription is armed means a subscription's
+        first updates are not dropped by `_async_callback` while later ones are still arming.
+        """
+        tid, status = adoIf.adoGetAsync(callback=self._async_callback, **kwargs)
+        self._tid_map[tid] = (group, scalars, callback, self)
+        return tid, status
+
+    def _deliver_initial(
+        self,
+        callback: Callback,
+        groups: Dict[str, List[Entry]],
+        grouped_entries: List[List[Entry]],
+        ppm_users: List[int],
+        metadata: MultinetResponse,
+    ):
+        """Read the current values of a new subscription and pass them to its callback, per group"""
+        for puser in ppm_users:
+            # one synchronous get for every group, split back out per group
+            initial_data = self._split_groups(
+                self._read(groups, [puser], MultinetResponse(), metadata),
+                grouped_entries,
+            )
+            for group_data in initial_data:
+                callback(group_data, puser)
+
+    @staticmethod
+    def _split_groups(
+        response: MultinetResponse, grouped_entries: List[List[Entry]]
+    ) -> List[MultinetResponse]:
+        group_index = {
+            entry: i for i, group in enumerate(grouped_entries) for entry in group
+        }
+        split = [MultinetResponse() for _ in grouped_entries]
+        for key, value in response.data.items():
+            i = group_index.get(key)
+            if i is None:
+                # timestampSource is reported alongside its timestamp entry
+                i = group_index.get(
+                    (*key[:-1], "timestampSeconds"),
+                    group_index.get((*key[:-1], "timestampNanoSeconds")),
+                )
+            if i is not None:
+                split[i][key] = value
+        return split
+
     def get(
         self, *entries: Entry, ppm_user=1, **kwargs
     ) -> MultinetResponse[Entry, Any]:
@@ -123,62 +233,53 @@ class AdoRequest(Request):
             warnings.warn("'timestamp' keyword argument deprecated; use 'valueAndTime' property instead.", DeprecationWarning)
 
         entries, response = self._parse_entries(entries, timestamps=kwargs.get("timestamp", False))
-        if not isinstance(ppm_user, Iterable):
+        if isinstance(ppm_user, int) or not isinstance(ppm_user, Iterable):
             ppm_user = [ppm_user]
-        for i, ppm in enumerate(ppm_user):
-            if ppm < 1 or ppm > 8:
-                # if a ppm user is duplicated, we'll allow it since it's just a synchronous request.
-                ppm_user[i] = self.default_ppm_user()
+        # if a ppm user is duplicated, we'll allow it since it's just a synchronous request.
+        ppm_user = [ppm if 1 <= ppm <= 8 else self.default_ppm_user() for ppm in ppm_user]
 
-        for ado_name, group in groupby(entries, itemgetter(0)):
-            group = list(group)
+        return self._read(self._group_by_ado(entries), ppm_user, response)
+
+    def _read(
+        self,
+        groups: Dict[str, List[Entry]],
+        ppm_user: List[int],
+        response: MultinetResponse,
+        metadata: Optional[MultinetResponse] = None,
+    ) -> MultinetResponse[Entry, Any]:
+        """Read parsed, ADO-grouped entries into `response`
+
+        `metadata` may be passed by callers which already fetched it for these entries.
+        """
+        if metadata is None:
+            metadata = self._get_meta_for_groups(groups)
+        calls = []
+        for ado_name, group in groups.items():
             handle = self._get_handle(ado_name)
             if not handle:
                 response.update(
                     dict.fromkeys(group, MultinetError(RhicError.IO_BAD_NAME))
                 )
                 continue
-            metadata = self.get_meta(*group)
-            for puser in ppm_user:
-                data, status = adoIf.adoGet(
-                    list=[(handle, *rest) for _, *rest in group], ppmIndex=puser - 1
-                )
-                if data is None:
-                    # this means none of the data reported successfully
-                    data = []
-                recv_time = time.time_ns()
-                data_iter = iter(data)
-                for entry, st in zip(group, status):
-                    if st != 0:
-                        if entry[-1] == "timestampSeconds":
-                            response[entry] = int(recv_time // 1e9)
-                            response[(*entry[:-1], "timestampSource")] = "ArrivalLocal"
-                        elif entry[-1] == "timestampNanoSeconds":
-                            response[entry] = int(recv_time % 1e9)
-                            response[(*entry[:-1], "timestampSource")] = "ArrivalLocal"
-                        else:
-                            response[entry] = MultinetError(st)
-                        continue
-                    value = next(data_iter)
-                    if value is None:
-                        response[entry] = value
-                        continue
-
-                    key = entry
-                    if len(ppm_user) > 1:
-                        key = entry + (puser,)
-                    
-                    value = value[0] if metadata[entry]["count"] == 1 else list(value)
-                    if value == 0 and entry[-1] in ("timestampSeconds", "timestampNanoSeconds"):
-                        if entry[-1] == "timestampSeconds":
-                            response[entry] = int(recv_time // 1e9)
-                            response[(*entry[:-1], "timestampSource")] = "ArrivalLocal"
-                        elif entry[-1] == "timestampNanoSeconds":
-                            response[entry] = int(recv_time % 1e9)
-                            response[(*entry[:-1], "timestampSource")] = "ArrivalLocal"
-                        continue
-
-                    response[key] = value
+            request_list = [(handle, entry[1], entry[2]) for entry in group]
+            scalars = self._scalar_mask(group, metadata)
+            calls += [(group, request_list, scalars, puser) for puser in ppm_user]
+
+        results = self._map_io(
+            adoIf.adoGet,
+            [
+                {"list": request_list, "ppmIndex": puser - 1}
+                for _, request_list, _, puser in calls
+            ],
+        )
+        for (group, _, scalars, puser), (data, status) in zip(calls, results):
+            if data is None:
+                # this means none of the data reported successfully
+                data = []
+            key_suffix = (puser,) if len(ppm_user) > 1 else ()
+            response.data.update(
+                self._iter_values(group, status, data, scalars, key_suffix)
+            )
         return response
 
     def get_meta(
@@ -187,20 +288,36 @@ class AdoRequest(Request):
         # first argument is always ADO
         # third  argument 'should' be value.  If it's the 'valueAndTime', 'valueAndTrigger', or 'timeInfo'
         # pseudo prop, change it.  If the tuple is != 3, no property was passed so we don't need to redefine.
-        orig_entries = copy.deepcopy(entries)
+        # entries are immutable, so the originals can be kept without copying
+        orig_entries = entries
         if len(entries[0]) == 3:
             entries = [(dev, param, prop) if (
                         prop != None and prop != 'valueAndTime' and prop != 'valueAndTrigger' and prop != 'timeInfo')
                        else (dev, param, 'value') for (dev, param, prop) in entries]
         entries, response = self._parse_entries(entries)
-        for ado_name, group in groupby(entries, itemgetter(0)):
-            handle = self._get_handle(ado_name)
-            if not handle:
-                response.update(
-                    dict.fromkeys(group, MultinetError(RhicError.IO_BAD_NAME))
-                )
-                continue
-            meta, st = adoIf.adoMetaData(handle)
+        response.update(
+            self._get_meta_for_groups(self._group_by_ado(entries), orig_entries)
+        )
+        return response
+
+    def _get_meta_for_groups(
+        self, groups: Dict[str, List[Entry]], orig_entries: Sequence[Entry] = ()
+    ) -> MultinetResponse[Entry, Union[Metadata, MultinetError]]:
+        response = MultinetResponse()
+        orig_by_param: Dict[Tuple[str, str], List[Entry]] = {}
+        for orig in orig_entries:
+            if len(orig) > 1:
+                orig_by_param.setdefault((orig[0], orig[1]), []).append(orig)
+
+        futures = self._get_meta_async(groups)
+        for ado_name in groups.keys() - futures.values():
+            response.update(
+                dict.fromkeys(groups[ado_name], MultinetError(RhicError.IO_BAD_NAME))
+            )
+
+        for future in as_completed(futures):
+            group = groups[futures[future]]
+            meta, st = future.result()
             for entry in group:
                 if not meta:
                     response[entry] = MultinetError("Metadata not available")
@@ -214,18 +331,98 @@ class AdoRequest(Request):
                         #         for key, value in meta.items()
                         #     }
                         # )
-                        response[entry] = meta
+                        # a copy, so callers can't mutate the cached metadata
+                        response[entry] = dict(meta)
                     if len(entry) == 2:
-                        response[entry] = dict(meta[(entry[1], "value")]._asdict())
+                        response[entry] = meta[(entry[1], "value")]._asdict()
                     elif len(entry) == 3:
                         # make sure we use the original requested entry when returning results and not the modified
                         # entry used to deal with the pseudo props
-                        e = [tup for tup in orig_entries if tup[0] == entry[0] and tup[1] == entry[1]]
-                        response[e[0] if len(e) == 1 else entry] = dict(meta[(entry[1], entry[2])]._asdict())
+                        e = orig_by_param.get((entry[0], entry[1]), ())
+                        response[e[0] if len(e) == 1 else entry] = meta[(entry[1], entry[2])]._asdict()
                 except KeyError:
                     response[entry] = MultinetError("Metadata not available")
         return response
 
+    @staticmethod
+    def _group_by_ado(entries: Iterable[Entry]) -> Dict[str, List[Entry]]:
+        groups: Dict[str, List[Entry]] = {}
+        for entry in entries:
+            groups.setdefault(entry[0], []).append(entry)
+        return groups
+
+    def _get_meta_async(self, ado_names: Iterable[str]) -> Dict[Future, str]:
+        """Submit `adoMetaData` for each uncached ADO to the I/O pool
+
+        Args:
+            ado_names (Iterable[str]): Unique ADO names to fetch metadata for
+
+        Returns:
+            Dict[Future, str]: Pending metadata futures mapped to their ADO name; ADOs without a handle are omitted
+        """
+        futures = {}
+        now = time.monotonic()
+        for ado_name in ado_names:
+            cached = self._meta_cache.get(ado_name)
+            if cached is not None and now - cached[0] < self.meta_timeout:
+                future = Future()
+                future.set_result(cached[1])
+                futures[future] = ado_name
+                continue
+
+            handle = self._get_handle(ado_name)
+            if handle:
+                future = self._io_executor.submit(self._fetch_meta, ado_name, handle)
+                futures[future] = ado_name
+        return futures
+
+    def _map_io(
+        self, func: Callable[..., Any], kwargs_list: List[Dict[str, Any]]
+    ) -> Iterator[Any]:
+        """Call `func` through `_call_io` once per kwargs dict, on the I/O pool when there is more than one call
+
+        Results are yielded in the same order as `kwargs_list`.
+        """
+        if len(kwargs_list) == 1:
+            return iter([self._call_io(func, **kwargs_list[0])])
+        return self._io_executor.map(
+            lambda kwargs: self._call_io(func, **kwargs), kwargs_list
+        )
+
+    @classmethod
+    def _call_io(cls, func: Callable[..., Any], *args, **kwargs):
+        """Call adoIf `func`, one adoIf call at a time across the process
+
+        cad_io makes no thread-safety guarantee for adoIf, and some of its state (set history,
+        cns connections) is shared by every handle, so no two adoIf calls ever overlap.
+        """
+        with cls._io_lock:
+            return func(*args, **kwargs)
+
+    def _fetch_meta(self, ado_name: str, handle) -> Tuple[Any, int]:
+        """Fetch `ado_name`'s metadata and update the cache before the fetch's future completes
+
+        A done-callback would run after `as_completed` has already woken the caller,
+        so an immediate second lookup could miss the cache and fetch again.
+        """
+        meta, st = self._call_io(adoIf.adoMetaData, handle)
+        if meta and not st:
+            self._meta_cache[ado_name] = (time.monotonic(), (meta, st))
+        else:
+            self._meta_cache.pop(ado_name, None)
+        return meta, st
+
+    def invalidate_meta(self, ado_name: Optional[str] = None):
+        """Drop cached metadata so it is fetched again on next use
+
+        Args:
+            ado_name (Optional[str], optional): ADO to invalidate. Defaults to None, which invalidates every ADO.
+        """
+        if ado_name is None:
+            self._meta_cache.clear()
+        else:
+            self._meta_cache.pop(ado_name, None)
+
     def set(
         self,
         *entries: Union[Entry, Dict[Entry, Any]],
@@ -233,17 +430,18 @@ class AdoRequest(Request):
         set_hist=None,
         **kwargs,
     ) -> MultinetResponse[Entry, MultinetError]:
-        if ppm_user < 1 or ppm_user > 8:
-            ppm_user = self.default_ppm_user()
+        ppm_user = ppm_user if 1 <= ppm_user <= 8 else self.default_ppm_user()
         orig_sethist = None
         # Override sethistory for call
         if set_hist is not None:
             # Store original sethist state
             orig_sethist = not adoIf.setHistory.storageOff
             # Set overrride
-            adoIf.keep_history(set_hist)
+            self._call_io(adoIf.keep_history, set_hist)
 
         entries, response = self._parse_sets(entries)
+        # one adoSet at a time, in the order given; callers rely on it (e.g. set a mode, then trigger)
+        # consecutive runs, not _group_by_ado: A, B, A must not become A, A, B
         for ado_name, group in groupby(entries, itemgetter(0)):
             group = list(group)
             handle = self._get_handle(ado_name)
@@ -251,23 +449,23 @@ class AdoRequest(Request):
 
             if not handle:
                 response.update(
-                    dict.fromkeys(group, MultinetError(RhicError.IO_BAD_NAME))
+                    dict.fromkeys(keys, MultinetError(RhicError.IO_BAD_NAME))
                 )
                 continue
 
-            metadata = self.get_meta(*keys)
-            _, status = adoIf.adoSet(
-                list=[(handle, *rest) for _, *rest in group], ppmIndex=ppm_user - 1
+            _, status = self._call_io(
+                adoIf.adoSet,
+                list=[(handle, entry[1], entry[2], entry[3]) for entry in group],
+                ppmIndex=ppm_user - 1,
+            )
+            response.data.update(
+                (entry, None if st == 0 else MultinetError(st))
+                for entry, st in zip(keys, status)
             )
-            for entry, st in zip(keys, status):
-                if st != 0:
-                    response[entry] = MultinetError(st)
-                else:
-                    response[entry] = None
 
         if orig_sethist is not None:
             # Restore original sethist state if stored
-            adoIf.keep_history(orig_sethist)
+            self._call_io(adoIf.keep_history, orig_sethist)
         return response
 
     def cancel_async(self, async_id: Union[MultinetResponse, AsyncID]=None):
@@ -291,14 +489,16 @@ class AdoRequest(Request):
             raise TypeError("mreq_response must be of type MultinetResponse or AsyncID")
 
         if async_id is None:
-            tids = [tid for tids in self._async_id_map.values() for tid in tids]
-            self._async_id_map.clear()
+            # swap in a fresh map rather than clearing the one a concurrent get_async may be adding to
+            async_id_map, self._async_id_map = self._async_id_map, {}
+            tids = [tid for tids in async_id_map.values() for tid in tids]
         else:
-            tids = self._async_id_map[async_id]
-            del self._async_id_map[async_id]
+            tids = self._async_id_map.pop(tid)
 
         for tid in tids:
-            adoIf.adoStopAsync(tid=tid)
+            # deliveries already in flight for a stopped tid are dropped by _async_callback and the dispatcher
+            self._tid_map.pop(tid, None)
+            self._call_io(adoIf.adoStopAsync, tid=tid)
 
     def set_history(self, enabled):
         """Enable or disable set history
@@ -306,53 +506,121 @@ class AdoRequest(Request):
         Args:
             enabled (bool): Enable set history if True, else disable
         """
-        adoIf.keep_history(enabled)
+        self._call_io(adoIf.keep_history, enabled)
+
+    def preconnect(self, *ado_names: str):
+        """Create ADO handles ahead of time, e.g. at application startup
+
+        Args:
+            *ado_names (str): ADOs which will be accessed later
+        """
+        for name in ado_names:
+            self._get_handle(name)
 
     def _get_handle(self, name: str):
-        if name not in self._handles:
-            self._handles[name] = adoIf.create_ado(name)
-        return self._handles[name]
+        try:
+            return self._handles[name]
+        except KeyError:
+            pass
+        # only a miss locks, so concurrent first uses of an ADO create one handle between them
+        with self._handle_locks.setdefault(name, threading.Lock()):
+            try:
+                return self._handles[name]
+            except KeyError:
+                handle = self._handles[name] = self._call_io(adoIf.create_ado, name)
+                return handle
+
+    @staticmethod
+    def _scalar_mask(entries: Iterable[Entry], metadata: MultinetResponse) -> List[bool]:
+        """Flag, in entry order, which entries hold a single value according to their metadata"""
+        get_meta = metadata.data.get
+        return [
+            isinstance(meta, dict) and meta.get("count") == 1
+            for meta in map(get_meta, entries)
+        ]
+
+    @staticmethod
+    def _iter_values(
+        entries: Iterable[Entry],
+        status: Iterable[int],
+        data: Iterable[Any],
+        scalars: Sequence[bool],
+        key_suffix: tuple = (),
+    ) -> Iterator[Tuple[Entry, Any]]:
+        """Yield decoded (key, value) pairs for an `adoGet`/`adoGetAsync` result
+
+        Timestamps that failed or read as 0 are replaced with the local arrival time,
+        which is only read from the clock when first needed.
+        """
+        recv_time = None
+        next_value = iter(data).__next__
+        for entry, st, scalar in zip(entries, status, scalars):
+            if st == 0:
+                value = next_value()
+                if value is None:
+                    yield entry, value
+                    continue
+                value = value[0] if scalar else list(value)
+                if value != 0 or entry[-1] not in ("timestampSeconds", "timestampNanoSeconds"):
+                    yield entry + key_suffix, value
+                    continue
+
+            if entry[-1] in ("timestampSeconds", "timestampNanoSeconds"):
+                if recv_time is None:
+                    recv_time = divmod(time.time_ns(), 1_000_000_000)
+                seconds, nanoseconds = recv_time
+                yield entry, seconds if entry[-1] == "timestampSeconds" else nanoseconds
+                yield _timestamp_source_key(entry), "ArrivalLocal"
+            else:
+                yield entry, MultinetError(st)
 
     @classmethod
     def _async_callback(cls, arg):
-        recv_time = time.time_ns()
         data, tid, requests, istatus, ppm_index = arg
-        entries, metadata, callback, inst = cls._tid_map.get(tid, (None, None, None, None))
+        entries, scalars, callback, inst = cls._tid_map.get(tid, (None, None, None, None))
         if entries is None:
             # TODO: Race condition?
             return
 
         ppm_user = ppm_index + 1
-        data_iter = iter(data)
-        response = MultinetResponse()
-        for entry, st in zip(entries, istatus):
-            if st != 0:
-                if entry[-1] == "timestampSeconds":
-                    response[entry] = int(recv_time // 1e9)
-                    response[(*entry[:-1], "timestampSource")] = "ArrivalLocal"
-                elif entry[-1] == "timestampNanoSeconds":
-                    response[entry] = int(recv_time % 1e9)
-                    response[(*entry[:-1], "timestampSource")] = "ArrivalLocal"
-                else:
-                    response[entry] = MultinetError(st)                
-                continue
+        response = MultinetResponse.from_iter(
+            cls._iter_values(entries, istatus, data, scalars)
+        )
+        response = inst._filter_data(response, ppm_user)
+        if response:
+            # user code runs on the dispatcher so a slow callback can't hold up adoIf's receiver
+            cls._dispatch_queue.put_nowait((tid, callback, response, ppm_user))
+
+    @classmethod
+    def _start_dispatcher(cls):
+        if cls._dispatch_thread is not None:
+            return
+        with cls._dispatch_lock:
+            if cls._dispatch_thread is None:
+                thread = threading.Thread(
+                    target=cls._dispatch_callbacks, name="multinet-dispatch", daemon=True
+                )
+                thread.start()
+                cls._dispatch_thread = thread
 
-            value = next(data_iter)
-            if value == 0 and entry[-1] in ("timestampSeconds", "timestampNanoSeconds"):
-                if entry[-1] == "timestampSeconds":
-                    response[entry] = int(recv_time // 1e9)
-                    response[(*entry[:-1], "timestampSource")] = "ArrivalLocal"
-                elif entry[-1] == "timestampNanoSeconds":
-                    response[entry] = int(recv_time % 1e9)
-                    response[(*entry[:-1], "timestampSource")] = "ArrivalLocal"
+    @classmethod
+    def _dispatch_callbacks(cls):
+        """Run queued async callbacks, in arrival order, for the life of the process"""
+        while True:
+            tid, callback, response, ppm_user = cls._dispatch_queue.get()
+            if tid not in cls._tid_map:
+                # cancelled after this update was queued
                 continue
+            cls._run_callback(callback, response, ppm_user)
 
-            response[entry] = (
-                value[0] if metadata[entry]["count"] == 1 else list(value)
-            )
-        response = inst._filter_data(response, ppm_user)
-        if response:
+    @classmethod
+    def _run_callback(cls, callback: Callback, response: MultinetResponse, ppm_user: int):
+        try:
             callback(response, ppm_user)
+        except Exception:
+            logging.getLogger(cls.__name__).exception(
+                "Error handling callback for %s", response.keys()
+            )
 
 
 
@@ -1,3 +1,8 @@
+from collections import UserDict
+
+_MISSING = object()
+
+
 class AnyChange:
     """Filter for async requests
 
@@ -10,9 +15,13 @@ class AnyChange:
     def __call__(self, data, ppm_user):
         old_data = self.old_data.get(ppm_user, {})
         self.old_data[ppm_user] = data
-        keys = [
-            key
-            for key in data.keys()
+        if isinstance(old_data, UserDict):
+            # MultinetResponse.get's second argument is should_raise, not a default
+            old_data = old_data.data
+        # single pass over the new data, stopping at the first changed value
+        changed = any(
+            old_data.get(key, _MISSING) != value
+            for key, value in data.items()
             if len(key) < 3
             or key[2]
             not in (
@@ -20,9 +29,8 @@ class AnyChange:
                 "timestampSeconds",
                 "timestampNanoSeconds",
             )
-        ]
-        same = all(key in old_data and old_data[key] == data[key] for key in keys)
-        if not same:
+        )
+        if changed:
             return data
         else:
             return {}
@@ -1,32 +1,73 @@
+import copy
 import getpass
-import http.client
-import json
 import os
 import socket
 import sys
 import threading
 import time
 import warnings
-from functools import lru_cache
-from itertools import groupby
-from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import *
+from urllib.parse import urlencode
 
 import requests
 from cad_error import RhicError
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
-from .request import (Callback, Entry, Metadata, MultinetError,
-                      MultinetResponse, Request)
+try:
+    # optional; parses the gateway's numeric payloads considerably faster
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from .request import (META_CACHE_TIMEOUT, Callback, Entry, Metadata,
+                      MultinetError, MultinetResponse, Request)
 
 HTTP_SERVER = "http://csgateway01.pbn.bnl.gov"
+HTTP_POOL_SIZE = 32
+"""Connections kept alive per host; async subscriptions are polled concurrently up to this many"""
+
+_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "Byte": int,
+    "Integer": int,
+    "Long": int,
+    "Short": int,
+    "Float": float,
+    "Double": float,
+    "String": str,
+}
+"""Parsers for the server's value strings, by reported data type"""
+
+
+@lru_cache(maxsize=256)
+def _encode_get_query(entries: Tuple[Entry, ...], ppm_user: int) -> str:
+    # polling callers repeat the same entries; requests sends a str query as is, skipping its URL encoding
+    names = ",".join([entry[0] for entry in entries])
+    props = ",".join([":".join(entry[1:]) for entry in entries])
+    return urlencode({"names": names, "props": props, "ppmuser": ppm_user})
 
 
 class HttpRequest(Request):
-    def __init__(self, server=HTTP_SERVER, polling_period=1.0) -> None:
+    def __init__(
+        self, server=HTTP_SERVER, polling_period=1.0, meta_timeout: float = META_CACHE_TIMEOUT
+    ) -> None:
         super().__init__()
         self.server = server
         self.polling_period = polling_period
+        self.meta_timeout = meta_timeout
         self._context = {}
+        self._meta_cache: Dict[Entry, Tuple[float, Any]] = {}
+        # keeps connections to the server alive between calls
+        self._session = requests.Session()
+        # retry only failures before the request was sent, so sets are never repeated
+        adapter = HTTPAdapter(
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=2, read=0, backoff_factor=0.1),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
         self._callbacks: Dict[str, Callback] = {}
         self._entries: dict[str, list[Entry]] = {}
@@ -35,69 +76,87 @@ class HttpRequest(Request):
         self._flag = threading.Event()
         self._thread: threading.Thread = None
 
-    @lru_cache(maxsize=32)
     def get_meta(
         self, *entries: Entry, **kwargs
     ) -> Dict[Entry, Union[Metadata, MultinetError]]:
         keys = ["name", "prop", "ppmuser"]
         metadata = {}
+        now = time.monotonic()
         for entry in entries:
+            cached = self._meta_cache.get(entry)
+            if cached is not None and now - cached[0] < self.meta_timeout:
+                # callers get a copy, so they can't mutate the cached metadata
+                metadata[entry] = copy.copy(cached[1])
+                continue
+
             payload = dict(zip(keys, entry))
             httpreq = self.server + "/DeviceServer/api/device/metaData"
             self.logger.debug("request: %s", httpreq)
             self.logger.debug("GETTING ADO DATA: %s", payload)
 
-            r = requests.get(
+            r = self._session.get(
                 httpreq, params=payload, headers={"Accept": "application/json"}
             )
-            self.logger.debug("<requests.get: %s, text: %s", r, r.text)
+            self.logger.debug("<requests.get: %s, content: %s", r, r.content)
             if r.status_code != requests.codes.ok:  # pylint: disable=no-member
                 error = r.headers.get("CAD-Error")
                 raise ValueError(error)
             else:
-                metadata[entry] = r.json()
+                meta = _json_loads(r.content)
+                self._meta_cache[entry] = (time.monotonic(), meta)
+                metadata[entry] = copy.copy(meta)
         return metadata
 
+    def invalidate_meta(self, entry: Optional[Entry] = None):
+        """Drop cached metadata so it is fetched again on next use
+
+        Args:
+            entry (Optional[Entry], optional): Entry to invalidate. Defaults to None, which invalidates every entry.
+        """
+        if entry is None:
+            self._meta_cache.clear()
+        else:
+            self._meta_cache.pop(entry, None)
+
     def get(
         self, *entries: Entry, ppm_user: Union[int, Iterable[int]] =1, timestamp=True, **kwargs
     ) -> Dict[Entry, Any]:
         entries, data = self._parse_entries(entries)
-        names, props = self._unpack_args(*entries)
-        if isinstance(ppm_user, Iterable):
+        if not isinstance(ppm_user, int) and isinstance(ppm_user, Iterable):
             warnings.warn("HttpRequest get does not support multiple ppm users.  Processing with first user in Iterable only", FutureWarning)
             ppm_user = ppm_user[0]
-        payload = dict(names=names, props=props, ppmuser=ppm_user)
+        payload = _encode_get_query(tuple(entries), ppm_user)
         httpreq = self.server + "/DeviceServer/api/device/list/numeric/valueAndTime"
         self.logger.debug("request: %s", httpreq)
         self.logger.debug("GETTING ADO DATA: %s", payload)
 
-        r = requests.get(
+        r = self._session.get(
             httpreq, params=payload, headers={"Accept": "application/json"}
         )
-        recv_time = time.time_ns()
-        self.logger.debug("<requests.get: %s, text: %s", r, r.text)
+        recv_seconds, recv_nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+        self.logger.debug("<requests.get: %s, content: %s", r, r.content)
         if r.status_code != requests.codes.ok:  # pylint: disable=no-member
             error = r.headers.get("CAD-Error")
             data = {entry: MultinetError(error) for entry in entries}
         else:
-            for entry in r.json():
+            for entry in _json_loads(r.content):
                 device = entry["device"]
                 others = entry["property"].split(":")
                 key: Entry = (device, *others)  # type: ignore
                 if "error" in entry:
                     if key[-1] == "timestampSeconds":
-                        data[key] = int(recv_time // 1e9)
+                        data[key] = recv_seconds
                         data[(*key[:-1], "timeStampSource")] = "ArrivalLocal"
                     elif key[-1] == "timestampNanoSeconds":
-                        data[key] = int(recv_time % 1e9)
+                        data[key] = recv_nanoseconds
                         data[(*key[:-1], "timeStampSource")] = "ArrivalLocal"
                     else:
                         data[key] = MultinetError(entry["error"])
                 elif "timestamp" in entry and "value" in entry and entry["value"] == 0:
                     if key[-1] == "timestampSeconds":
-                        data[key] = int(recv_time // 1e9)
+                        data[key] = recv_seconds
                     elif key[-1] == "timestampNanoSeconds":
-                        data[key] = int(recv_time % 1e9)
+                        data[key] = recv_nanoseconds
                     data[(*key[:-1], "timeStampSource")] = "ArrivalLocal"
                 else:
                     type_ = entry["type"]
@@ -121,7 +180,7 @@ class HttpRequest(Request):
         if set_hist is None:
             set_hist = self._set_hist
         context = self._get_context(set_hist)
-        names, props, values = self._unpack_args(*entries, is_set=True)
+        names, props, values = self._unpack_args(*entries)
         payload = {
             "names": names,
             "props": props,
@@ -133,14 +192,14 @@ class HttpRequest(Request):
         headers = {"Accept": "application/json"}
         self.logger.debug("PUT %s <%s>: %s", url, headers, payload)
         try:
-            r = requests.put(url, params=payload, headers=headers)
-            data = {}
+            r = self._session.put(url, params=payload, headers=headers)
         except requests.exceptions.RequestException as exc:
-            data = {entry: MultinetError(exc) for entry in entries}
+            # one error instance is shared by every entry of the failed request
+            return dict.fromkeys(entries, MultinetError(exc))
         if r.status_code != requests.codes.ok:  # pylint: disable=no-member
             error = r.headers.get("CAD-Error")
-            data = {entry: MultinetError(error) for entry in entries}
-        return data
+            return dict.fromkeys(entries, MultinetError(error))
+        return {}
 
     def get_async(
         self,
@@ -155,16 +214,14 @@ class HttpRequest(Request):
             warnings.warn("'timestamp' keyword argument deprecated; use 'valueAndTime' property instead.", DeprecationWarning)
 
         entries, data = self._parse_entries(entries, timestamps=kwargs.get("timestamp", False))
-        names, props = self._unpack_args(*entries)
-
-        if isinstance(ppm_user, Iterable):
+        if not isinstance(ppm_user, int) and isinstance(ppm_user, Iterable):
             warnings.warn("HttpRequest get_async does not support multiple ppm users.  Processing with first user in Iterable only", FutureWarning)
             ppm_user = ppm_user[0]
 
-        payload = {"names": names, "props": props, "ppmuser": ppm_user}
+        payload = _encode_get_query(tuple(entries), ppm_user)
         url = HTTP_SERVER + "/DeviceServer/api/device/list/numeric/async"
 
-        r = requests.get(url, params=payload)
+        r = self._session.get(url, params=payload)
         if r.status_code != requests.codes.ok:  # pylint: disable=no-member
             error = r.headers.get("CAD-Error")
             return {entry: MultinetError(error) for entry in entries}
@@ -196,99 +253,119 @@ class HttpRequest(Request):
             self._callbacks.clear()
             self._flag.clear()
 
-        for req in reqs:
-            requests.get(req, headers={"Accept": "application/json"})
+        # cancels are independent; send them all at once rather than one round trip each
+        cancel = partial(self._session.get, headers={"Accept": "application/json"})
+        with ThreadPoolExecutor(HTTP_POOL_SIZE, thread_name_prefix="multinet-cancel") as executor:
+            list(executor.map(cancel, reqs))
 
     def set_history(self, enabled):
         self._set_hist = enabled
 
-    def _async_thread(self):
-        endpoint = "/DeviceServer/api/device/async/result"
-
-        if self.server.startswith("https://"):
-            client = http.client.HTTPSConnection(self.server.removeprefix("https://"))
-        else:
-            client = http.client.HTTPConnection(self.server.removeprefix("http://"))
-
-        while not self._flag.wait(self.polling_period):        
-            with self._lock:
-                ids = list(self._entries.keys())
-
-            responses = (
-                client.request(
-                    "GET",
-                    endpoint + f"?id={id_}",
-                    headers={"Accept": "application/json"},
-                )
-                or client.getresponse()
-                for id_ in self._entries
-            )
-            id_responses = (
-                response.begin() or (id_, response)
-                for id_, response in zip(ids, responses)
-                if response.status < 300
-            )
-            id_data = [(id, json.load(response)) for id, response in id_responses]
-            
-            recv_time = time.time_ns()
+    def close(self):
+        """Close pooled connections to the server"""
+        self._session.close()
 
-            for id_, group in id_data:
-                response = MultinetResponse()
-                callback = self._callbacks[id_]
-                ppm_user = None
-
-                group_data = {}
-
-                if group["ndata"] == 0:
-                    continue
+    def _async_thread(self):
+        url = self.server + "/DeviceServer/api/device/async/result"
 
-                for item in group["deviceData"]:
-                    device: str = item["device"]
-                    prop: str = item["property"]
-                    (param, prop) = (
-                        prop.split(":", 1) if ":" in prop else (prop, "value")
-                    )
+        # bound once; these are looked up for every subscription on every poll
+        callbacks = self._callbacks
+        subscriptions = self._entries
+        filter_data = self._filter_data
+        session = self._session
+        headers = {"Accept": "application/json"}
 
-                    if "error" in item:
-                        response[device, param, prop] = MultinetError(item["error"])
-                        continue
-                    
-                    if "data" in item:
-                        value = item["data"]
-                    elif "value" in item:
-                        value = item["value"]
-                    else:
-                        response[device, param, prop] = MultinetError(RhicError.ADO_NO_DATA)
+        def poll(id_):
+            try:
+                r = session.get(url, params={"id": id_}, headers=headers)
+            except requests.exceptions.RequestException as exc:
+                self.logger.error("async poll failed: %s", exc)
+                return None
+            if r.status_code >= 300:
+                return None
+            try:
+                return _json_loads(r.content)
+            except ValueError as exc:
+                self.logger.error("async poll returned invalid JSON: %s", exc)
+                return None
+
+        # subscriptions are polled concurrently, so a poll costs one round trip rather than one per id
+        with ThreadPoolExecutor(HTTP_POOL_SIZE, thread_name_prefix="multinet-poll") as executor:
+            while not self._flag.wait(self.polling_period):
+                with self._lock:
+                    ids = list(subscriptions.keys())
+
+                id_data = [
+                    (id_, group)
+                    for id_, group in zip(ids, executor.map(poll, ids))
+                    if group is not None
+                ]
+
+                recv_seconds, recv_nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+
+                for id_, group in id_data:
+                    response = MultinetResponse()
+                    # fill the backing dict directly; UserDict.__setitem__ is a Python-level call per key
+                    values = response.data
+                    callback = callbacks[id_]
+                    ppm_user = None
+
+                    group_data = {}
+
+                    if group["ndata"] == 0:
                         continue
 
-                    if ppm_user is None:
-                        ppm_user: int = item["ppmuser"]
-                    elif item["ppmuser"] != ppm_user:
-                        raise ValueError(
-                            f"PPM User Mismatch in Async: {ppm_user} != {item['ppm_user']}"
+                    for item in group["deviceData"]:
+                        device: str = item["device"]
+                        prop: str = item["property"]
+                        (param, prop) = (
+                            prop.split(":", 1) if ":" in prop else (prop, "value")
                         )
 
+                        if "error" in item:
+                            values[device, param, prop] = MultinetError(item["error"])
+                            continue
 
-                    if "isarray" in item and not item["isarray"]:
-                        value = value[0]
-
-                    group_data[device, param, prop] = value
-                
-                for key in self._entries[id_]:
-                    if key in group_data:
-                        response[key] = group_data[key]
-                    elif key[-1] == "timestampSeconds":
-                        response[key] = int(recv_time // 1e9)
-                        response[(*key[:-1], "timeStampSource")] = "ArrivalLocal"
-                    elif key[-1] == "timestampNanoSeconds":
-                        response[key] = int(recv_time % 1e9)
-                        response[(*key[:-1], "timeStampSource")] = "ArrivalLocal"
-                    else:
-                        response[key] = MultinetError(RhicError.ADO_DATA_MISSING)
+                        if "data" in item:
+                            value = item["data"]
+                        elif "value" in item:
+                            value = item["value"]
+                        else:
+                            values[device, param, prop] = MultinetError(RhicError.ADO_NO_DATA)
+                            continue
+
+                        if ppm_user is None:
+                            ppm_user: int = item["ppmuser"]
+                        elif item["ppmuser"] != ppm_user:
+                            raise ValueError(
+                                f"PPM User Mismatch in Async: {ppm_user} != {item['ppm_user']}"
+                            )
+
+
+                        if "isarray" in item and not item["isarray"]:
+                            value = value[0]
+
+                        group_data[device, param, prop] = value
+
+                    for key in subscriptions[id_]:
+                        # one lookup for the common case where the key was reported
+                        try:
+                            values[key] = group_data[key]
+                            continue
+                        except KeyError:
+                            pass
+                        if key[-1] == "timestampSeconds":
+                            values[key] = recv_seconds
+                            values[(*key[:-1], "timeStampSource")] = "ArrivalLocal"
+                        elif key[-1] == "timestampNanoSeconds":
+                            values[key] = recv_nanoseconds
+                            values[(*key[:-1], "timeStampSource")] = "ArrivalLocal"
+                        else:
+                            values[key] = MultinetError(RhicError.ADO_DATA_MISSING)
 
-                response = self._filter_data(response, ppm_user)
-                if response:
-                    callback(response, ppm_user)
+                    response = filter_data(response, ppm_user)
+                    if response:
+                        callback(response, ppm_user)
 
     def _get_context(self, with_sethist):
         if with_sethist not in self._context:
@@ -306,7 +383,7 @@ class HttpRequest(Request):
             httpreq = self.server + "/DeviceServer/api/device/context"
             # we don't need to process as json since this request will return io simple text value
             try:
-                r = requests.get(httpreq, params=payload)  # type: ignore
+                r = self._session.get(httpreq, params=payload)  # type: ignore
             except requests.exceptions.RequestException as exc:
                 self.logger.error("get context failed: %s", exc)
                 return 2
@@ -317,31 +394,20 @@ class HttpRequest(Request):
     @staticmethod
     def _convert_value(val, type_):
         # convert string to doubles (scalar or array), if possible.
-        if val[0] == "[":
-            val = [HttpRequest._convert_value(x, type_) for x in val[1:-1].split()]
-        elif type_ in ("Byte", "Integer", "Long", "Short"):
-            val = int(val)
-        elif type_ in ("Float", "Double"):
-            val = float(val)
-        elif type_ != "String":
+        convert = _CONVERTERS.get(type_)
+        if convert is None:
             warnings.warn(f"Unknown data type {type_}; interpreting as string")
-        return val
+            convert = str
+        if val[0] == "[":
+            return [convert(x) for x in val[1:-1].split()]
+        return convert(val)
 
     @staticmethod
-    def _unpack_args(*entries: Entry, is_set=False) -> Tuple[str, ...]:
-        entries = [tuple(ent) for ent in entries]
-        names, props, values = [], [], []
-        for entry in entries:
-            device_name = entry[0]
-            names.append(device_name)
-            if is_set and len(entry) > 2:
-                prop = entry[1:-1]
-                props.append(":".join(prop))
-                values.append(entry[-1])
-            elif not is_set:
-                prop = entry[1:]
-                props.append(":".join(prop))
-        if is_set:
-            return ",".join(names), ",".join(props), ",".join(map(str, values))
-        else:
-            return ",".join(names), ",".join(props)
+    def _unpack_args(*entries: Entry) -> Tuple[str, str, str]:
+        # entries without a value can't be set; skip them in every column so names stay aligned
+        entries = [entry for entry in entries if len(entry) > 2]
+        return (
+            ",".join([entry[0] for entry in entries]),
+            ",".join([":".join(entry[1:-1]) for entry in entries]),
+            ",".join([str(entry[-1]) for entry in entries]),
+        )
@@ -207,14 +207,14 @@ class HttpRequest(Request):
                 response = r.json()
                 nvals = response["ndata"]
                 if nvals > 0:
-                    device_data = response["deviceData"]
+                    # groupby only merges adjacent items, so interleaved users must be sorted together first
+                    device_data = sorted(response["deviceData"], key=itemgetter("ppmuser"))
                     for ppm_user, data in groupby(
                         device_data, itemgetter("ppmuser")
                     ):
                         results = []
                         data = list(data)
                         for item in data:
-                            print(data)
                             device = item["device"]
                             others = item["property"].split(":")
                             key: Entry = (device, *others)  # type: ignore
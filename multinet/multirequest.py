@@ -2,6 +2,7 @@ import socket
 import warnings
 from collections import defaultdict
 from enum import Enum
+from functools import lru_cache
 from ipaddress import ip_address, ip_network
 from typing import *
 
@@ -13,11 +14,16 @@ from .request import (Callback, Entry, Metadata, MultinetError,
                       MultinetResponse, Request)
 
 
+@lru_cache(maxsize=None)
+def _local_ip_addr():
+    # consulted for every newly seen device; a failed lookup raises, so only successes are cached
+    return socket.gethostbyname(socket.gethostname())
+
+
 def is_controls_host(ip_addr=None):
     if not ip_addr:
         try:
-            host_name = socket.gethostname()
-            ip_addr = socket.gethostbyname(host_name)
+            ip_addr = _local_ip_addr()
         except:  # pylint: disable=bare-except
             warnings.warn("Unable to get Hostname and IP")
             return False
@@ -83,6 +89,8 @@ class Multirequest(Request):
 
     def clear_metadata(self):
         self._ado_req._handles.clear()
+        self._ado_req.invalidate_meta()
+        self._http_req.invalidate_meta()
         adoIf._metadata_dict.clear()
 
     def get_meta(
@@ -8,16 +8,36 @@ import re
 import traceback
 from abc import ABC, abstractmethod
 from collections import UserDict
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
+from operator import eq
 from typing import *
 
 from cad_error import RhicError
 
 Entry = Union[Tuple[str, str], Tuple[str, str, str], str]
 """Entry type alias"""
+META_CACHE_TIMEOUT = 600.0
+"""Seconds before cached metadata is fetched again"""
 AsyncID = int
 """Async ID type alias"""
 
+
+@lru_cache(maxsize=1024)
+def _split_entry(entry: str) -> Tuple[str, ...]:
+    # string entries are reused across calls, so their key tuples are built once
+    return tuple(entry.split(":"))
+
+
+@lru_cache(maxsize=1024)
+def _value_and_time(ado: str, param: str) -> Tuple[Entry, Entry, Entry]:
+    # 'valueAndTime' expands the same way on every request for a parameter
+    return (
+        (ado, param, "value"),
+        (ado, param, "timestampSeconds"),
+        (ado, param, "timestampNanoSeconds"),
+    )
+
+
 class MultinetResponse(UserDict):
     @wraps(UserDict.__init__)
     def __init__(self, *args, **kwargs):
@@ -28,6 +48,20 @@ class MultinetResponse(UserDict):
         Used with `AdoRequest.cancel_async` to cancel individual requests
         """
 
+    @classmethod
+    def from_iter(cls, pairs: Iterable[Tuple[Entry, Any]]) -> "MultinetResponse":
+        """Build a response directly from (key, value) pairs, bypassing per-item `__setitem__`
+
+        Args:
+            pairs (Iterable[Tuple[Entry, Any]]): Key/value pairs
+
+        Returns:
+            MultinetResponse: New response
+        """
+        response = cls()
+        response.data = dict(pairs)
+        return response
+
     def get_error(self, key: Entry) -> Optional["MultinetError"]:
         """Returns RhicError associated with entry, if it exists
 
@@ -63,10 +97,7 @@ class MultinetResponse(UserDict):
         Returns:
             Dict[Entry, Optional[MultinetError]]: Dictionary of multinet errors
         """
-        return {
-            k: self.get(k, None)
-            for k in self
-        }
+        return {k: v for k, v in self.data.items() if isinstance(v, MultinetError)}
 
     def get(self, key: Entry, should_raise=True) -> Union[Any, "MultinetError"]:
         """Return value for entry
@@ -119,22 +150,21 @@ class MultinetResponse(UserDict):
         return super().__contains__(key)
 
     def _get_wildcard(self, key: Entry):
-        subset = self.copy()
-        for i, piece in enumerate(key):
-            if "*" in piece:
-                r = re.compile(piece.replace("*", ".*"))
-                for k in list(subset):
-                    if not r.match(k[i]):
-                        del subset[k]
-            else:
-                for k in list(subset):
-                    if k[i] != piece:
-                        del subset[k]
+        matchers = [
+            re.compile(piece.replace("*", ".*")).match if "*" in piece else partial(eq, piece)
+            for piece in key
+        ]
+        subset = self.from_iter(
+            (k, v)
+            for k, v in self.data.items()
+            if all(match(k[i]) for i, match in enumerate(matchers))
+        )
+        subset.tid = self.tid
         return subset
 
     def _tranform_key(self, key: Entry):
         if isinstance(key, str):
-            key = tuple(key.split(":"))  # type: ignore
+            key = _split_entry(key)  # type: ignore
 
         if len(key) == 2:
             key = (key[0], key[1], "value")
@@ -342,6 +372,9 @@ class Request(ABC):
 
     def _filter_data(self, data, ppm_user):
         for filter_ in self._filters:
+            if not data:
+                # nothing left for later filters to act on
+                break
             data = filter_(data, ppm_user)
         return data
 
@@ -352,7 +385,7 @@ class Request(ABC):
             if isinstance(entry, str):
                 str_split = cast(
                     Union[Tuple[str, str], Tuple[str, str, str]],
-                    tuple(entry.split(":")),
+                    _split_entry(entry),
                 )
                 entry = str_split
 
@@ -363,14 +396,10 @@ class Request(ABC):
             if len(entry) == 2:
                 entry = (entry[0], entry[1], "value")
 
-            entry = cast(Tuple[str, str, str], entry)
+            entry = cast(Tuple[str, str, str], tuple(entry))
             # Check for psuedo properties & convert as needed
             if entry[2] == "valueAndTime" or (entry[2] == "value" and timestamps):
-                ret += [
-                    (entry[0], entry[1], "value"),
-                    (entry[0], entry[1], "timestampSeconds"),
-                    (entry[0], entry[1], "timestampNanoSeconds"),
-                ]
+                ret += _value_and_time(entry[0], entry[1])
             elif entry[2] in ("timeInfo", "valueAndTrigger", "valueAndCycle"):
                 errors[entry] = MultinetError(f"Pseudo-property {entry[2]} unsupported")
             else:
@@ -1,19 +1,64 @@
 import logging
+from collections import namedtuple
+from itertools import count
 from threading import Condition, Event, Thread
 from time import sleep
 
 import pytest
 from cad_error import RhicError
-from multinet import filters
+from multinet import ado_request, filters
 from multinet.ado_request import AdoRequest
 from multinet.request import MultinetResponse
 
+FakeMeta = namedtuple("FakeMeta", "count")
+
+
+class FakeAdoIf:
+    """Stands in for cad_io's adoIf so AdoRequest can be tested without a control system"""
+
+    def __init__(self):
+        self.meta_calls = 0
+        self.meta_status = 0
+        self.subs = {}
+        self.stopped = []
+        self._tids = count(100)
+
+    def create_ado(self, name):
+        return name
+
+    def keep_history(self, enabled):
+        pass
+
+    def adoMetaData(self, handle):
+        self.meta_calls += 1
+        return {("intS", "value"): FakeMeta(1), ("intS", "timestampSeconds"): FakeMeta(1)}, self.meta_status
+
+    def adoGetAsync(self, list, ppmIndex, callback):
+        tid = next(self._tids)
+        self.subs[tid] = (list, ppmIndex, callback)
+        return tid, [0] * len(list)
+
+    def adoStopAsync(self, tid):
+        self.stopped.append(tid)
+
+    def deliver(self, tid, *values):
+        requests, ppm_index, callback = self.subs[tid]
+        callback(([[value] for value in values], tid, requests, [0] * len(values), ppm_index))
+
 
 @pytest.fixture(scope="function")
 def req():
     return AdoRequest()
 
 
+@pytest.fixture(scope="function")
+def fake_ado(monkeypatch):
+    fake = FakeAdoIf()
+    monkeypatch.setattr(ado_request, "adoIf", fake)
+    monkeypatch.setattr(AdoRequest, "_tid_map", {})
+    return fake
+
+
 def test_array(req):
     data = req.get(("simple.test", "charArrayS"), ("simple.test", "charS"))
     assert isinstance(data, MultinetResponse)
@@ -108,3 +153,151 @@ def test_set(req: AdoRequest):
 def test_set_wrong_type(req: AdoRequest):
     err = req.set({"simple.test:longS": "bad value"})
     assert err.get_status("simple.test:longS") == RhicError.ADOIF_CANNOT_CONVERT_DATA_TYPE
+
+
+def test_meta_cached(fake_ado: FakeAdoIf):
+    req = AdoRequest()
+    req.get_meta(("simple.test", "intS"))
+    meta = req.get_meta(("simple.test",))
+    meta[("simple.test",)].clear()
+    assert ("intS", "value") in req.get_meta(("simple.test",))[("simple.test",)]
+    assert fake_ado.meta_calls == 1
+
+
+def test_meta_invalidate(fake_ado: FakeAdoIf):
+    req = AdoRequest()
+    req.get_meta(("simple.test", "intS"), ("simple.other", "intS"))
+    req.invalidate_meta("simple.test")
+    req.get_meta(("simple.test", "intS"), ("simple.other", "intS"))
+    assert fake_ado.meta_calls == 3
+    req.invalidate_meta()
+    req.get_meta(("simple.test", "intS"), ("simple.other", "intS"))
+    assert fake_ado.meta_calls == 5
+
+
+def test_meta_timeout(fake_ado: FakeAdoIf, monkeypatch):
+    req = AdoRequest(meta_timeout=5.0)
+    req.get_meta(("simple.test", "intS"))
+    now = ado_request.time.monotonic()
+    monkeypatch.setattr(ado_request.time, "monotonic", lambda: now + 6.0)
+    req.get_meta(("simple.test", "intS"))
+    assert fake_ado.meta_calls == 2
+
+
+def test_meta_failure_not_cached(fake_ado: FakeAdoIf):
+    req = AdoRequest()
+    fake_ado.meta_status = 1
+    req.get_meta(("simple.test", "intS"))
+    fake_ado.meta_status = 0
+    req.get_meta(("simple.test", "intS"))
+    req.get_meta(("simple.test", "intS"))
+    assert fake_ado.meta_calls == 2
+
+
+def test_split_groups():
+    grouped_entries = [
+        [("simple.test", "intS", "value"), ("simple.test", "intS", "timestampSeconds")],
+        [("simple.other", "intS", "value")],
+    ]
+    response = MultinetResponse(
+        {
+            ("simple.test", "intS", "value"): 7,
+            ("simple.test", "intS", "timestampSeconds"): 100,
+            ("simple.test", "intS", "timestampSource"): "ArrivalLocal",
+            ("simple.other", "intS", "value"): 3,
+        }
+    )
+    first, second = AdoRequest._split_groups(response, grouped_entries)
+    assert first == {
+        ("simple.test", "intS", "value"): 7,
+        ("simple.test", "intS", "timestampSeconds"): 100,
+        ("simple.test", "intS", "timestampSource"): "ArrivalLocal",
+    }
+    assert second == {("simple.other", "intS", "value"): 3}
+
+
+def test_timestamp_fallback_reads_clock_lazily(monkeypatch):
+    reads = []
+    monkeypatch.setattr(ado_request.time, "time_ns", lambda: reads.append(1) or 5_000_000_000)
+    entries = [("simple.test", "intS", "value"), ("simple.test", "intS", "timestampSeconds")]
+    values = dict(AdoRequest._iter_values(entries, [0, 0], [[7], [100]], [True, True]))
+    assert values == {entries[0]: 7, entries[1]: 100}
+    assert reads == []
+
+    entries.append(("simple.test", "intS", "timestampNanoSeconds"))
+    values = dict(AdoRequest._iter_values(entries, [0, 0, 1], [[7], [0]], [True, True, True]))
+    assert values[entries[1]] == 5
+    assert values[entries[2]] == 0
+    assert values[("simple.test", "intS", "timestampSource")] == "ArrivalLocal"
+    assert len(reads) == 1
+
+
+def test_timestamp_fallback_exact_split(monkeypatch):
+    monkeypatch.setattr(ado_request.time, "time_ns", lambda: 1_700_000_000_123_456_789)
+    entries = [("simple.test", "intS", "timestampSeconds"), ("simple.test", "intS", "timestampNanoSeconds")]
+    values = dict(AdoRequest._iter_values(entries, [0, 0], [[0], [0]], [True, True]))
+    assert values[entries[0]] == 1_700_000_000
+    assert values[entries[1]] == 123_456_789
+
+
+def test_get_async_update_while_arming(fake_ado: FakeAdoIf, monkeypatch):
+    received = Event()
+    arm = fake_ado.adoGetAsync
+
+    def adoGetAsync(list, ppmIndex, callback):
+        # subscriptions armed earlier in the same get_async update while this one arms
+        for tid in tuple(fake_ado.subs):
+            fake_ado.deliver(tid, 7)
+        return arm(list, ppmIndex, callback)
+
+    monkeypatch.setattr(fake_ado, "adoGetAsync", adoGetAsync)
+    req = AdoRequest()
+    req.get_async(
+        lambda data, ppm_user: received.set(),
+        ("simple.test", "intS"),
+        ("simple.other", "intS"),
+        grouping="individual",
+    )
+    assert received.wait(5)
+    req.cancel_async()
+
+
+def test_dispatch_drops_cancelled(fake_ado: FakeAdoIf):
+    req = AdoRequest()
+    release = Event()
+    done = Event()
+    received = []
+
+    blocker = req.get_async(lambda data, ppm_user: release.wait(5), ("simple.test", "intS"))
+    cancelled = req.get_async(lambda data, ppm_user: received.append(data), ("simple.test", "intS"))
+    # the dispatcher is held in the first callback while the second update waits in the queue
+    fake_ado.deliver(req._async_id_map[blocker.tid][0], 1)
+    fake_ado.deliver(req._async_id_map[cancelled.tid][0], 2)
+    req.cancel_async(cancelled)
+    release.set()
+
+    live = req.get_async(lambda data, ppm_user: done.set(), ("simple.test", "intS"))
+    fake_ado.deliver(req._async_id_map[live.tid][0], 3)
+    assert done.wait(5)
+    assert received == []
+    req.cancel_async()
+
+
+def test_cancel_async_response(fake_ado: FakeAdoIf):
+    req = AdoRequest()
+    callback = lambda data, ppm_user: None
+    kept = req.get_async(callback, ("simple.test", "intS"))
+    cancelled = req.get_async(callback, ("simple.other", "intS"))
+    kept_tids = req._async_id_map[kept.tid]
+    cancelled_tids = req._async_id_map[cancelled.tid]
+
+    req.cancel_async(cancelled)
+    assert fake_ado.stopped == cancelled_tids
+    assert cancelled.tid not in req._async_id_map
+    assert all(tid not in AdoRequest._tid_map for tid in cancelled_tids)
+    assert all(tid in AdoRequest._tid_map for tid in kept_tids)
+
+    with pytest.raises(ValueError):
+        req.cancel_async(MultinetResponse())
+    req.cancel_async()
+    assert fake_ado.stopped == cancelled_tids + kept_tids
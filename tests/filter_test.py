@@ -1,4 +1,5 @@
 from multinet import filters
+from multinet.request import MultinetResponse
 from random import randint
 
 
@@ -27,3 +28,24 @@ class TestAnyChange:
         assert f_data == data
         f_data2 = filter_(data, 1)
         assert f_data2 == {}
+
+    def test_timestamp_only_change(self):
+        filter_ = filters.AnyChange()
+        data = get_fake_data()
+        filter_(data, 1)
+        data2 = dict(data)
+        data2[("simple.test", "intS", "timestampSeconds")] += 1
+        f_data2 = filter_(data2, 1)
+        assert f_data2 == {}
+
+    def test_new_key_in_response(self):
+        filter_ = filters.AnyChange()
+        filter_(MultinetResponse({("simple.test", "intS", "value"): 1}), 1)
+        data = MultinetResponse(
+            {
+                ("simple.test", "intS", "value"): 1,
+                ("simple.test", "stringS", "value"): None,
+            }
+        )
+        f_data = filter_(data, 1)
+        assert f_data == data
@@ -1,5 +1,7 @@
 import logging
+import time
 from threading import Condition
+from types import SimpleNamespace
 
 import pytest
 from cad_io.adoaccess import IORequest
@@ -63,3 +65,66 @@ def test_async(req: HttpRequest):
 @pytest.mark.skip()
 def test_cdev(req: HttpRequest):
     req.get(("simple.cdev2", "doubleS"))
+
+
+def test_unpack_set_columns():
+    names, props, values = HttpRequest._unpack_args(
+        ("simple.test", "intS", 7),
+        ("simple.test", "floatS", "value", 3.14),
+    )
+    assert names == "simple.test,simple.test"
+    assert props == "intS,floatS:value"
+    assert values == "7,3.14"
+
+
+def test_unpack_set_skips_entries_without_value():
+    names, props, values = HttpRequest._unpack_args(
+        ("simple.test", "intS"),
+        ("simple.other", "floatS", 3.14),
+    )
+    assert names == "simple.other"
+    assert props == "floatS"
+    assert values == "3.14"
+
+
+class FakeSession:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None):
+        self.calls += 1
+        return SimpleNamespace(status_code=200, content=b'{"count": 1}', headers={})
+
+
+@pytest.fixture()
+def meta_req(monkeypatch):
+    req = HttpRequest(meta_timeout=60.0)
+    monkeypatch.setattr(req, "_session", FakeSession())
+    return req
+
+
+def test_meta_cached(meta_req: HttpRequest):
+    entry = ("simple.test", "intS")
+    first = meta_req.get_meta(entry)
+    first[entry]["count"] = 2
+    assert meta_req.get_meta(entry) == {entry: {"count": 1}}
+    assert meta_req._session.calls == 1
+
+
+def test_meta_expires(meta_req: HttpRequest, monkeypatch):
+    entry = ("simple.test", "intS")
+    meta_req.get_meta(entry)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61.0)
+    meta_req.get_meta(entry)
+    assert meta_req._session.calls == 2
+
+
+def test_meta_invalidate(meta_req: HttpRequest):
+    entry = ("simple.test", "intS")
+    meta_req.get_meta(entry)
+    meta_req.invalidate_meta(entry)
+    meta_req.get_meta(entry)
+    meta_req.invalidate_meta()
+    meta_req.get_meta(entry)
+    assert meta_req._session.calls == 3
@@ -0,0 +1,46 @@
+from multinet.request import MultinetError, MultinetResponse
+
+
+def get_response():
+    response = MultinetResponse(
+        {
+            ("simple.test", "intS", "value"): 7,
+            ("simple.test", "sinM", "value"): 0.5,
+            ("simple.test", "sinM", "timestampSeconds"): 100,
+            ("simple.other", "intS", "value"): 3,
+        }
+    )
+    response.tid = 5
+    return response
+
+
+class TestMultinetResponse:
+    def test_get_errors(self):
+        response = get_response()
+        error = MultinetError("Metadata not available")
+        response[("simple.test", "floatS", "value")] = error
+        assert response.get_errors() == {("simple.test", "floatS", "value"): error}
+
+    def test_get_errors_none(self):
+        assert get_response().get_errors() == {}
+
+
+class TestWildcard:
+    def test_wildcard_param(self):
+        subset = get_response()[("simple.test", "sin*", "*")]
+        assert subset == {
+            ("simple.test", "sinM", "value"): 0.5,
+            ("simple.test", "sinM", "timestampSeconds"): 100,
+        }
+
+    def test_wildcard_ado(self):
+        subset = get_response()["simple.*:intS"]
+        assert subset == {
+            ("simple.test", "intS", "value"): 7,
+            ("simple.other", "intS", "value"): 3,
+        }
+
+    def test_wildcard_keeps_tid(self):
+        subset = get_response()[("*", "intS")]
+        assert isinstance(subset, MultinetResponse)
+        assert subset.tid == 5